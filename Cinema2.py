@@ -1,8 +1,8 @@
 """
-Cinema Seat Booking Simulator (turtle version)
-- OOP structure with Seat and CinemaHall
-- Fast drawing via tracer(0, 0)
-- Persist seat states to seats.json (auto-save on every toggle)
+Cinema Seat Booking Simulator (tkinter version)
+- CinemaHall keeps seats as flat arrays (booked bitmap, centers)
+- Fast drawing on a raw tkinter.Canvas: items are created once, then recolored
+- Persist seat states to seats.bin as a bitmap (debounced auto-save after toggles)
 - UI: free/sold counters, legend, "SCREEN" bar
 - Controls:
     * Mouse click  : toggle a seat
@@ -10,10 +10,13 @@ Cinema Seat Booking Simulator (turtle version)
     * Q / Escape   : save and exit
 """
 
+import atexit
 import json
-import math
+import mmap
 import os
-import turtle
+import struct
+import tkinter as tk
+from tkinter import font as tkfont
 
 
 # --------------- Config --------------- #
@@ -29,7 +32,9 @@ SEAT_GAP_Y = 24       # vertical gap between rows
 TOP_MARGIN = 150      # space for "SCREEN" banner
 BOTTOM_MARGIN = 80    # space for counters/legend
 
-DATA_FILE = "seats.json"
+DATA_FILE = "seats.bin"
+LEGACY_DATA_FILE = "seats.json"   # imported once if no bitmap exists yet
+SAVE_DELAY_MS = 500   # coalesce clicks within this window into one write
 
 # Colors
 COLOR_BG = "#0f0f14"
@@ -40,63 +45,52 @@ COLOR_TEXT = "#e6edf3"
 COLOR_NOTE = "#8b949e"
 COLOR_SCREEN = "#30363d"
 
-# Turtle speed tweaks
-turtle.colormode(255)
+SEAT_TAG = "seat"     # canvas tag shared by all seat ovals
 
 
-# --------------- Model --------------- #
-class Seat:
-    """Single seat model + drawing helper."""
-    def __init__(self, row: int, col: int, x: float, y: float, r: float):
-        self.row = row
-        self.col = col
-        self.x = x
-        self.y = y
-        self.r = r
-        self.booked = False
-
-    def contains(self, px: float, py: float) -> bool:
-        """Point-in-circle hit test."""
-        return math.hypot(px - self.x, py - self.y) <= self.r
-
-    def draw(self, pen: turtle.Turtle):
-        """Draw the seat as a filled circle with outline."""
-        fill = COLOR_SEAT_SOLD if self.booked else COLOR_SEAT_FREE
-        pen.up()
-        pen.goto(self.x, self.y - self.r)
-        pen.setheading(0)
-        pen.down()
-        pen.color(COLOR_SEAT_OUTLINE, fill)
-        pen.begin_fill()
-        pen.circle(self.r)
-        pen.end_fill()
-
-    def to_dict(self):
-        return {"row": self.row, "col": self.col, "booked": self.booked}
-
-    def from_dict(self, data):
-        self.booked = bool(data.get("booked", False))
+def _cv(x, y):
+    """Map hall coordinates (origin at window center, y up) to canvas pixels."""
+    return x + WINDOW_W / 2, WINDOW_H / 2 - y
 
 
+# --------------- Model --------------- #
 class CinemaHall:
     """Cinema grid of seats with drawing, events, and persistence."""
-    def __init__(self, rows, cols, radius, gap_x, gap_y):
+    def __init__(self, canvas: tk.Canvas, rows, cols, radius, gap_x, gap_y):
+        self.canvas = canvas
         self.rows = rows
         self.cols = cols
         self.radius = radius
         self.gap_x = gap_x
         self.gap_y = gap_y
 
-        self.seats: list[Seat] = []
-        self.pen = turtle.Turtle(visible=False)
-        self.pen.speed(0)
-        self.pen.pensize(2)
-
-        self.text = turtle.Turtle(visible=False)
-        self.text.speed(0)
+        # structure-of-arrays seat storage, row-major: seat i is at
+        # row i // cols, col i % cols
+        self._n = rows * cols
+        self._state_int = 0                    # bit i set = seat i sold
+        self._xs: list[float] = []             # seat centers
+        self._ys: list[float] = []
+        self._ovals: list[int] = []            # Tk canvas item per seat
+        self._r2 = radius * radius
+        self._counter_item = None              # "Free / Sold" text item
+
+        # resolve fonts once instead of having Tk parse a font tuple per item
+        self._font_screen = tkfont.Font(family="Verdana", size=16, weight="bold")
+        self._font_counter = tkfont.Font(family="Verdana", size=14, weight="bold")
+        self._font_label = tkfont.Font(family="Verdana", size=12)
+        self._font_note = tkfont.Font(family="Verdana", size=11)
+
+        self._sold = 0
+        self._static_drawn = False
+        self._dirty = False
+        self._save_scheduled = False
+        # bitmap currently on disk; None means nothing on disk, always write
+        self._last_saved_int = None
 
         self._build_grid()
         self.load_state()
+        # counted once here; toggle_at / reset_all keep it current
+        self._sold = self._state_int.bit_count()
 
     # ---------- layout ----------
     def _grid_origin(self):
@@ -109,94 +103,144 @@ class CinemaHall:
         return x0, y0
 
     def _build_grid(self):
-        """Create seat objects with computed positions."""
-        self.seats.clear()
+        """Compute seat center positions."""
         x0, y0 = self._grid_origin()
-        for r in range(self.rows):
-            for c in range(self.cols):
-                x = x0 + c * (2 * self.radius + self.gap_x) + self.radius
-                y = y0 + r * (2 * self.radius + self.gap_y) + self.radius
-                self.seats.append(Seat(r, c, x, y, self.radius))
+        self._x0, self._y0 = x0, y0
+        self._pitch_x = 2 * self.radius + self.gap_x
+        self._pitch_y = 2 * self.radius + self.gap_y
+        # one coordinate per column / row, then expand to row-major order
+        col_xs = [x0 + c * self._pitch_x + self.radius for c in range(self.cols)]
+        row_ys = [y0 + r * self._pitch_y + self.radius for r in range(self.rows)]
+        self._xs[:] = col_xs * self.rows
+        self._ys[:] = [y for y in row_ys for _ in range(self.cols)]
 
     # ---------- persistence ----------
+    # seats.bin layout: little-endian uint16 rows, uint16 cols, then one bit
+    # per seat (seat i -> byte i >> 3, bit i & 7) in row-major order.
+    _HEADER = struct.Struct("<HH")
+
     def load_state(self):
         if not os.path.exists(DATA_FILE):
+            self._load_legacy_state()
             return
+        hdr = self._HEADER.size
+        size = hdr + (self._n + 7) // 8
+        # mmap-backed read; int.from_bytes still copies the payload into a
+        # temporary bytes object internally
         try:
-            with open(DATA_FILE, "r", encoding="utf-8") as f:
+            with open(DATA_FILE, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if len(mm) != size:
+                    return
+                if self._HEADER.unpack_from(mm) != (self.rows, self.cols):
+                    return  # saved for a different grid
+                with memoryview(mm) as view:
+                    # byte i >> 3, bit i & 7 is exactly little-endian int bit order
+                    bits = int.from_bytes(view[hdr:], "little")
+                # drop padding bits past the last seat in the final byte
+                self._state_int = bits & ((1 << self._n) - 1)
+                self._last_saved_int = self._state_int
+        except (OSError, ValueError):  # ValueError: empty file can't be mapped
+            return
+
+    def _load_legacy_state(self):
+        """Import an old seats.json and rewrite it as a bitmap."""
+        if not os.path.exists(LEGACY_DATA_FILE):
+            return
+        try:
+            with open(LEGACY_DATA_FILE, "r", encoding="utf-8") as f:
                 data = json.load(f)
         except Exception:
             return
-        # map by (row,col)
-        state = {(d["row"], d["col"]): d for d in data.get("seats", [])}
-        for seat in self.seats:
-            d = state.get((seat.row, seat.col))
-            if d:
-                seat.from_dict(d)
+        for d in data.get("seats", []):
+            r, c = d["row"], d["col"]
+            if 0 <= r < self.rows and 0 <= c < self.cols and d.get("booked"):
+                self._state_int |= 1 << (r * self.cols + c)
+        try:
+            self.save_state()
+        except OSError:
+            # keep the imported state in memory; _last_saved_int stays None,
+            # so the next save retries the conversion
+            self._dirty = True
 
     def save_state(self):
-        data = {"seats": [s.to_dict() for s in self.seats]}
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        """Write state atomically: dump to a temp file, then replace."""
+        if self._state_int == self._last_saved_int:
+            self._dirty = False
+            return  # disk already holds this state
+        bits = self._state_int.to_bytes((self._n + 7) // 8, "little")
+        tmp = DATA_FILE + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(self._HEADER.pack(self.rows, self.cols))
+            f.write(bits)
+        os.replace(tmp, DATA_FILE)
+        self._last_saved_int = self._state_int
+        self._dirty = False
+
+    def _schedule_save(self):
+        """Mark state dirty and save once the click burst settles."""
+        self._dirty = True
+        if not self._save_scheduled:
+            self._save_scheduled = True
+            self.canvas.after(SAVE_DELAY_MS, self._flush)
+
+    def _flush(self):
+        self._save_scheduled = False
+        self.flush()
+
+    def flush(self):
+        """Save now if there are unsaved changes."""
+        if self._dirty:
+            self.save_state()
 
     # ---------- drawing ----------
     def draw_all(self):
-        turtle.tracer(0, 0)
-        self._draw_background()
+        """Create every canvas item once; later changes only touch dirty items."""
+        if not self._static_drawn:
+            self._draw_static()
+        self._redraw_footer_counters()
+
+    def _draw_static(self):
+        """Create the banner, legend, help, counters, and seat items."""
         self._draw_screen_banner()
-        self._draw_seats()
-        self._draw_footer()
-        turtle.update()
-
-    def _draw_background(self):
-        self.pen.clear()
-        self.text.clear()
-        bg = turtle.Turtle(visible=False)
-        bg.speed(0)
-        bg.up(); bg.goto(-WINDOW_W/2, -WINDOW_H/2); bg.down()
-        bg.color(COLOR_BG, COLOR_BG)
-        bg.begin_fill()
-        for _ in range(2):
-            bg.forward(WINDOW_W); bg.left(90)
-            bg.forward(WINDOW_H); bg.left(90)
-        bg.end_fill()
-        bg.clear()  # avoid lingering heavy turtle
-        del bg
+        self._draw_legend()
+        self._create_seat_items()  # filled from the loaded state
+        x, y = _cv(-WINDOW_W/2 + 20, -WINDOW_H/2 + 30)
+        self._counter_item = self.canvas.create_text(
+            x, y, anchor="sw", fill=COLOR_TEXT, font=self._font_counter)
+        self._static_drawn = True
 
     def _draw_screen_banner(self):
         # banner rectangle
-        self.pen.up()
         top_y = WINDOW_H/2 - 70
-        self.pen.goto(-WINDOW_W/2 + 80, top_y)
-        self.pen.color(COLOR_SCREEN, COLOR_SCREEN)
-        self.pen.down()
-        self.pen.begin_fill()
-        for _ in range(2):
-            self.pen.forward(WINDOW_W - 160); self.pen.left(90)
-            self.pen.forward(28); self.pen.left(90)
-        self.pen.end_fill()
+        x0, y0 = _cv(-WINDOW_W/2 + 80, top_y)
+        x1, y1 = _cv(WINDOW_W/2 - 80, top_y + 28)
+        self.canvas.create_rectangle(x0, y0, x1, y1,
+                                     fill=COLOR_SCREEN, outline=COLOR_SCREEN)
 
         # "SCREEN" label
-        self.text.up()
-        self.text.color(COLOR_TEXT)
-        self.text.goto(0, top_y + 6)
-        self.text.write("SCREEN", align="center", font=("Verdana", 16, "bold"))
-
-    def _draw_seats(self):
-        for s in self.seats:
-            s.draw(self.pen)
-
-    def _draw_footer(self):
-        free = sum(not s.booked for s in self.seats)
-        sold = self.rows * self.cols - free
-
-        # counters
-        self.text.up()
-        self.text.color(COLOR_TEXT)
-        self.text.goto(-WINDOW_W/2 + 20, -WINDOW_H/2 + 30)
-        self.text.write(f"Free: {free}   Sold: {sold}",
-                        align="left", font=("Verdana", 14, "bold"))
-
+        x, y = _cv(0, top_y + 6)
+        self.canvas.create_text(x, y, text="SCREEN", anchor="s",
+                                fill=COLOR_TEXT, font=self._font_screen)
+
+    def _create_seat_items(self):
+        """Create one canvas oval per seat."""
+        r = self.radius
+        self._ovals = []
+        for i, (x, y) in enumerate(zip(self._xs, self._ys)):
+            cx, cy = _cv(x, y)
+            self._ovals.append(self.canvas.create_oval(
+                cx - r, cy - r, cx + r, cy + r, fill=self._seat_fill(i),
+                outline=COLOR_SEAT_OUTLINE, width=2, tags=SEAT_TAG))
+
+    def _seat_fill(self, i):
+        return COLOR_SEAT_SOLD if self._state_int >> i & 1 else COLOR_SEAT_FREE
+
+    def _draw_seat(self, i):
+        """Recolor seat i's oval to match its state."""
+        self.canvas.itemconfig(self._ovals[i], fill=self._seat_fill(i))
+
+    def _draw_legend(self):
         # legend (two samples)
         legend_x = WINDOW_W/2 - 220
         legend_y = -WINDOW_H/2 + 40
@@ -204,69 +248,97 @@ class CinemaHall:
         self._legend_dot(legend_x + 110, legend_y, COLOR_SEAT_SOLD, "Sold")
 
         # help
-        self.text.color(COLOR_NOTE)
-        self.text.goto(0, -WINDOW_H/2 + 30)
-        self.text.write("Click seats to toggle   •   R = reset   •   Q / Esc = save & quit",
-                        align="center", font=("Verdana", 11, "normal"))
+        x, y = _cv(0, -WINDOW_H/2 + 30)
+        self.canvas.create_text(
+            x, y, anchor="s", fill=COLOR_NOTE, font=self._font_note,
+            text="Click seats to toggle   •   R = reset   •   Q / Esc = save & quit")
+
+    def _redraw_footer_counters(self):
+        """Rewrite only the counters, leaving legend and help untouched."""
+        free = self.rows * self.cols - self._sold
+        self.canvas.itemconfig(self._counter_item,
+                               text=f"Free: {free}   Sold: {self._sold}")
 
     def _legend_dot(self, x, y, color, label):
-        self.pen.up(); self.pen.goto(x, y); self.pen.down()
-        self.pen.color(COLOR_SEAT_OUTLINE, color)
-        self.pen.begin_fill()
-        self.pen.circle(8)
-        self.pen.end_fill()
-        self.text.up(); self.text.color(COLOR_TEXT)
-        self.text.goto(x + 18, y - 6)
-        self.text.write(label, align="left", font=("Verdana", 12, "normal"))
+        # dot of radius 8 resting on (x, y), label to its right
+        cx, cy = _cv(x, y + 8)
+        self.canvas.create_oval(cx - 8, cy - 8, cx + 8, cy + 8, fill=color,
+                                outline=COLOR_SEAT_OUTLINE, width=2)
+        tx, ty = _cv(x + 18, y - 6)
+        self.canvas.create_text(tx, ty, text=label, anchor="sw",
+                                fill=COLOR_TEXT, font=self._font_label)
 
     # ---------- interactions ----------
     def toggle_at(self, x, y):
         """Toggle a seat if click is inside; return True if any changed."""
-        changed = False
-        # iterate in reverse drawing order so visually topmost seats get priority
-        for seat in reversed(self.seats):
-            if seat.contains(x, y):
-                seat.booked = not seat.booked
-                changed = True
-                break
-        if changed:
-            self.save_state()
-            self.draw_all()
-        return changed
+        # seats sit on a regular lattice, so the nearest one is found by
+        # arithmetic; only that single candidate needs a circle test
+        col = round((x - self._x0 - self.radius) / self._pitch_x)
+        row = round((y - self._y0 - self.radius) / self._pitch_y)
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return False
+        i = row * self.cols + col
+        # bounding-box rejection first: clicks in the gaps between seats
+        # fail one of these comparisons before any multiplication
+        r = self.radius
+        dx = x - self._xs[i]
+        if not -r <= dx <= r:
+            return False
+        dy = y - self._ys[i]
+        if not -r <= dy <= r:
+            return False
+        if dx * dx + dy * dy > self._r2:
+            return False
+
+        self._state_int ^= 1 << i
+        self._sold += 1 if self._state_int >> i & 1 else -1
+        self._schedule_save()
+
+        # redraw only the dirty seat and the counters
+        self._draw_seat(i)
+        self._redraw_footer_counters()
+        return True
 
     def reset_all(self):
-        for s in self.seats:
-            s.booked = False
-        self.save_state()
-        self.draw_all()
+        self._state_int = 0
+        self._sold = 0
+        self._schedule_save()
 
+        # one tagged itemconfig recolors every seat in a single Tk call
+        self.canvas.itemconfig(SEAT_TAG, fill=COLOR_SEAT_FREE)
+        self._redraw_footer_counters()
 
-# --------------- App setup --------------- #
-screen = turtle.Screen()
-screen.setup(WINDOW_W, WINDOW_H)
-screen.title("Cinema Seat Booking — turtle")
-screen.bgcolor(COLOR_BG)
 
-hall = CinemaHall(ROWS, COLS, SEAT_RADIUS, SEAT_GAP_X, SEAT_GAP_Y)
+# --------------- App setup --------------- #
+root = tk.Tk()
+root.title("Cinema Seat Booking — tkinter")
+root.resizable(False, False)
+canvas = tk.Canvas(root, width=WINDOW_W, height=WINDOW_H,
+                   bg=COLOR_BG, highlightthickness=0)
+canvas.pack()
+
+hall = CinemaHall(canvas, ROWS, COLS, SEAT_RADIUS, SEAT_GAP_X, SEAT_GAP_Y)
 hall.draw_all()
+atexit.register(hall.flush)  # window closed without Q / Esc
 
 
 # --------------- Event bindings --------------- #
-def on_click(x, y):
-    hall.toggle_at(x, y)
+def on_click(event):
+    # canvas pixels -> hall coordinates (origin at center, y up)
+    hall.toggle_at(event.x - WINDOW_W / 2, WINDOW_H / 2 - event.y)
 
-def on_reset():
+def on_reset(event):
     hall.reset_all()
 
-def on_quit():
-    hall.save_state()
-    screen.bye()
+def on_quit(event):
+    hall.flush()
+    root.destroy()
 
 # Mouse + keys
-screen.onscreenclick(on_click, btn=1, add=False)
-screen.onkey(on_reset, "r")
-screen.onkey(on_quit, "q")
-screen.onkey(on_quit, "Escape")
-screen.listen()
+canvas.bind("<Button-1>", on_click)
+root.bind("<Key-r>", on_reset)
+root.bind("<Key-q>", on_quit)
+root.bind("<Escape>", on_quit)
+canvas.focus_set()
 
-turtle.done()
\ No newline at end of file
+root.mainloop()